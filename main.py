@@ -1,4 +1,8 @@
 import json
+import math
+import os
+import sys
+import warnings
 import datetime
 from typing import List, Dict
 from dataclasses import dataclass
@@ -29,52 +33,127 @@ class FinanceTracker:
     def __init__(self, data_file: str = "transactions.json"):
         self.data_file = data_file
         self.transactions: List[Transaction] = []
+        self._balance_cents = 0
+        self._pending: List[Transaction] = []
+        # Records left out of the balance but written back on every rewrite.
+        self._skipped: List[dict] = []
+        self._needs_compaction = False
         self.load_data()
     
     def load_data(self):
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-                for item in data:
-                    transaction = Transaction(
-                        amount=item['amount'],
-                        category=item['category'],
-                        description=item['description'],
-                        date=datetime.date.fromisoformat(item['date']),
-                        transaction_type=TransactionType(item['type'])
-                    )
-                    self.transactions.append(transaction)
+            f = open(self.data_file, 'r')
         except FileNotFoundError:
             self.transactions = []
+            self._balance_cents = 0
+            return
+        with f:
+            # Many transactions share a date; parse each distinct string once.
+            dates: Dict[str, datetime.date] = {}
+            for item in self._read_items(f):
+                if not math.isfinite(item['amount']):
+                    warnings.warn(f"Ignoring transaction with non-finite amount "
+                                  f"(kept in {self.data_file}): {item!r}")
+                    self._skipped.append(item)
+                    continue
+                date = dates.get(item['date'])
+                if date is None:
+                    date = dates[item['date']] = datetime.date.fromisoformat(item['date'])
+                category = item['category']
+                if isinstance(category, str):
+                    category = sys.intern(category)
+                transaction = Transaction(
+                    amount=item['amount'],
+                    category=category,
+                    description=item['description'],
+                    date=date,
+                    transaction_type=TransactionType(item['type'])
+                )
+                self._append(transaction)
+    
+    def _read_items(self, f):
+        previous = None
+        for line in f:
+            if not line.strip():
+                continue
+            if previous is None and line.lstrip().startswith('['):
+                # Legacy single-array file; rewritten as JSON Lines on next flush.
+                f.seek(0)
+                self._needs_compaction = True
+                yield from json.load(f)
+                return
+            if previous is not None:
+                yield json.loads(previous)
+            previous = line
+        if previous is None:
+            return
+        try:
+            item = json.loads(previous)
+        except json.JSONDecodeError:
+            # A torn final line from an interrupted append; drop it on next flush.
+            warnings.warn(f"Skipping unreadable last line in {self.data_file}: {previous!r}")
+            self._needs_compaction = True
+            return
+        yield item
     
     def save_data(self):
-        with open(self.data_file, 'w') as f:
-            json.dump([t.to_dict() for t in self.transactions], f, indent=2)
+        tmp_file = self.data_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            f.writelines(json.dumps(t.to_dict()) + '\n' for t in self.transactions)
+            f.writelines(json.dumps(item) + '\n' for item in self._skipped)
+        os.replace(tmp_file, self.data_file)
+        self._pending = []
+        self._needs_compaction = False
+    
+    def flush(self):
+        # Legacy or torn files are only rewritten once there is something to save.
+        if not self._pending:
+            return
+        if self._needs_compaction:
+            self.save_data()
+            return
+        records = ''.join(json.dumps(t.to_dict()) + '\n' for t in self._pending)
+        with open(self.data_file, 'a+b') as f:
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    records = '\n' + records
+            f.write(records.encode())
+        self._pending = []
     
     def add_transaction(self, amount: float, category: str, description: str, 
                        transaction_type: TransactionType):
+        if not math.isfinite(amount):
+            raise ValueError(f"Amount must be finite, got {amount!r}")
         transaction = Transaction(
             amount=amount,
-            category=category,
+            category=sys.intern(category),
             description=description,
             date=datetime.date.today(),
             transaction_type=transaction_type
         )
+        self._append(transaction)
+        self._pending.append(transaction)
+    
+    def _append(self, transaction: Transaction):
+        cents = round(transaction.amount * 100)
         self.transactions.append(transaction)
-        self.save_data()
+        if transaction.transaction_type is TransactionType.INCOME:
+            self._balance_cents += cents
+        else:
+            self._balance_cents -= cents
     
     def get_balance(self) -> float:
-        balance = 0
-        for transaction in self.transactions:
-            if transaction.transaction_type == TransactionType.INCOME:
-                balance += transaction.amount
-            else:
-                balance -= transaction.amount
-        return balance
+        return self._balance_cents / 100
 
 def main():
     tracker = FinanceTracker()
-    
+    try:
+        run_menu(tracker)
+    finally:
+        tracker.flush()
+
+def run_menu(tracker: FinanceTracker):
     while True:
         print("\n--- Personal Finance Tracker ---")
         print("1. Add Income")
@@ -86,16 +165,24 @@ def main():
         
         if choice == '1':
             amount = float(input("Enter income amount: "))
+            if not math.isfinite(amount):
+                print("Invalid amount!")
+                continue
             category = input("Enter category: ")
             description = input("Enter description: ")
             tracker.add_transaction(amount, category, description, TransactionType.INCOME)
+            tracker.flush()
             print("Income added successfully!")
             
         elif choice == '2':
             amount = float(input("Enter expense amount: "))
+            if not math.isfinite(amount):
+                print("Invalid amount!")
+                continue
             category = input("Enter category: ")
             description = input("Enter description: ")
             tracker.add_transaction(amount, category, description, TransactionType.EXPENSE)
+            tracker.flush()
             print("Expense added successfully!")
             
         elif choice == '3':
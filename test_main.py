@@ -0,0 +1,146 @@
+import json
+import os
+import tempfile
+import unittest
+import warnings
+
+from main import FinanceTracker, TransactionType
+
+
+class DataFileTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.data_file = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        self.addCleanup(os.remove, self.data_file)
+
+    def read_lines(self):
+        with open(self.data_file) as f:
+            return [json.loads(line) for line in f]
+
+    def test_legacy_array_is_migrated_to_json_lines(self):
+        legacy = [
+            {'amount': 100.0, 'category': 'Salary', 'description': 'pay',
+             'date': '2026-10-01', 'type': 'income'},
+            {'amount': 25.5, 'category': 'Food', 'description': 'lunch',
+             'date': '2026-10-02', 'type': 'expense'},
+        ]
+        with open(self.data_file, 'w') as f:
+            json.dump(legacy, f, indent=2)
+
+        tracker = FinanceTracker(self.data_file)
+        self.assertEqual(tracker.get_balance(), 74.5)
+        tracker.flush()
+        with open(self.data_file) as f:
+            self.assertEqual(json.load(f), legacy)
+
+        tracker.add_transaction(10.0, 'Food', 'dinner', TransactionType.EXPENSE)
+        tracker.flush()
+
+        lines = self.read_lines()
+        self.assertEqual(lines[:2], legacy)
+        self.assertEqual(lines[2]['description'], 'dinner')
+        self.assertEqual(FinanceTracker(self.data_file).get_balance(), 64.5)
+
+    def test_append_round_trip(self):
+        tracker = FinanceTracker(self.data_file)
+        tracker.add_transaction(50.0, 'Salary', 'pay', TransactionType.INCOME)
+        tracker.flush()
+        tracker.add_transaction(20.0, 'Rent', 'rent', TransactionType.EXPENSE)
+        tracker.flush()
+
+        self.assertEqual(len(self.read_lines()), 2)
+        reloaded = FinanceTracker(self.data_file)
+        self.assertEqual(reloaded.transactions, tracker.transactions)
+        self.assertEqual(reloaded.get_balance(), 30.0)
+
+    def test_empty_file(self):
+        tracker = FinanceTracker(self.data_file)
+        self.assertEqual(tracker.transactions, [])
+        self.assertEqual(tracker.get_balance(), 0)
+        tracker.flush()
+        self.assertEqual(self.read_lines(), [])
+
+    def write_text(self, text):
+        with open(self.data_file, 'w') as f:
+            f.write(text)
+
+    def test_torn_last_line_is_skipped_and_cleaned_on_flush(self):
+        self.write_text(
+            '{"amount": 10.0, "category": "Salary", "description": "pay", '
+            '"date": "2026-10-01", "type": "income"}\n'
+            '{"amount": 3.0, "categ'
+        )
+        with self.assertWarns(UserWarning):
+            tracker = FinanceTracker(self.data_file)
+        self.assertEqual(tracker.get_balance(), 10.0)
+        tracker.add_transaction(1.0, 'Food', 'lunch', TransactionType.EXPENSE)
+        tracker.flush()
+
+        descriptions = [item['description'] for item in self.read_lines()]
+        self.assertEqual(descriptions, ['pay', 'lunch'])
+
+    def test_bad_line_in_the_middle_raises(self):
+        self.write_text(
+            '{"amount": 10.0, "category": "Salary", "description": "pay", '
+            '"date": "2026-10-01", "type": "income"}\n'
+            'not json\n'
+            '{"amount": 3.0, "category": "Food", "description": "lunch", '
+            '"date": "2026-10-02", "type": "expense"}\n'
+        )
+        with self.assertRaises(json.JSONDecodeError):
+            FinanceTracker(self.data_file)
+
+    def test_append_to_file_without_trailing_newline(self):
+        self.write_text(
+            '{"amount": 10.0, "category": "Salary", "description": "pay", '
+            '"date": "2026-10-01", "type": "income"}'
+        )
+        tracker = FinanceTracker(self.data_file)
+        tracker.add_transaction(4.0, 'Food', 'lunch', TransactionType.EXPENSE)
+        tracker.flush()
+
+        reloaded = FinanceTracker(self.data_file)
+        self.assertEqual(len(reloaded.transactions), 2)
+        self.assertEqual(reloaded.get_balance(), 6.0)
+
+    def test_non_finite_amount_is_rejected_without_changing_state(self):
+        tracker = FinanceTracker(self.data_file)
+        tracker.add_transaction(5.0, 'Salary', 'pay', TransactionType.INCOME)
+        for amount in (float('inf'), float('nan')):
+            with self.assertRaises(ValueError):
+                tracker.add_transaction(amount, 'Food', 'x', TransactionType.EXPENSE)
+        self.assertEqual(len(tracker.transactions), 1)
+        self.assertEqual(tracker.get_balance(), 5.0)
+
+    def test_non_finite_records_on_disk_are_skipped_and_kept(self):
+        legacy = [
+            {'amount': 10.0, 'category': 'Salary', 'description': 'pay',
+             'date': '2026-10-01', 'type': 'income'},
+            {'amount': float('inf'), 'category': 'Food', 'description': 'bad',
+             'date': '2026-10-02', 'type': 'expense'},
+        ]
+        with open(self.data_file, 'w') as f:
+            json.dump(legacy, f)
+
+        with self.assertWarns(UserWarning):
+            tracker = FinanceTracker(self.data_file)
+        self.assertEqual(len(tracker.transactions), 1)
+        self.assertEqual(tracker.get_balance(), 10.0)
+        tracker.add_transaction(1.0, 'Food', 'lunch', TransactionType.EXPENSE)
+        tracker.flush()
+
+        descriptions = [item['description'] for item in self.read_lines()]
+        self.assertCountEqual(descriptions, ['pay', 'lunch', 'bad'])
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            self.assertEqual(FinanceTracker(self.data_file).get_balance(), 9.0)
+
+    def test_balance_is_exact_in_cents(self):
+        tracker = FinanceTracker(self.data_file)
+        tracker.add_transaction(0.1, 'Gift', 'a', TransactionType.INCOME)
+        tracker.add_transaction(0.2, 'Gift', 'b', TransactionType.INCOME)
+        self.assertEqual(tracker.get_balance(), 0.3)
+
+
+if __name__ == '__main__':
+    unittest.main()